@@ -0,0 +1,218 @@
+import heapq
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+from heuristics import TILE_COSTS
+from puzzle import Puzzle, flat_moves_table
+from solvers import AStar, GBFS, UCS, ISolvable
+
+# Optional backend: without Numba, the solvers below are the pure-Python ones
+try:
+    import numba
+    import numpy as np
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+TILE_BITS = 4
+TILE_MASK = (1 << TILE_BITS) - 1
+MAX_TILES = 15  # Whole state packed in one signed 64 bits int
+
+SolverResult = Tuple[List[Tuple[Puzzle, int, int]], Dict[Puzzle, Tuple[int, int, int]]]
+
+
+def pack(grid: Tuple[int, ...]) -> int:
+    state = 0
+    for i, t in enumerate(grid):
+        state |= t << (TILE_BITS * i)
+    return state
+
+
+def unpack(state: int, count: int) -> Tuple[int, ...]:
+    return tuple((state >> (TILE_BITS * i)) & TILE_MASK for i in range(count))
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(nogil=True, cache=True)
+    def _astar_kernel(start, start_empty, goals, count, move_counts, move_tiles, move_costs, tile_costs, greedy):
+        # Same search as solvers.AStar, on packed states: moves, ties & closed set handling must stay identical
+        costs = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=numba.types.int64)
+        parents = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=numba.types.int64)
+        closed = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=numba.types.int64)
+        closed_order = numba.typed.List.empty_list(numba.types.int64)
+        closed_f = numba.typed.List.empty_list(numba.types.int64)
+        closed_h = numba.typed.List.empty_list(numba.types.int64)
+
+        costs[start] = 0
+        counter = 1
+        heap = [(0, 0, start, 0, 0, start_empty)]  # f, insertion count, state, g, h, empty tile index
+        found = -1
+
+        while len(heap) > 0:
+            f, _, state, g, h, empty = heapq.heappop(heap)
+
+            # Outdated entry, node was already reached with a cheaper path
+            if state in closed:
+                continue
+
+            closed[state] = g
+            closed_order.append(state)
+            closed_f.append(f)
+            closed_h.append(h)
+
+            for k in range(goals.shape[0]):
+                if state == goals[k]:
+                    found = state
+            if found != -1:
+                break
+
+            for m in range(move_counts[empty]):
+                tile_i = move_tiles[empty, m]
+                tile = (state >> (TILE_BITS * tile_i)) & TILE_MASK
+
+                # Moved tile takes the place of the empty tile
+                next_state = (state & ~(TILE_MASK << (TILE_BITS * tile_i))) | (tile << (TILE_BITS * empty))
+                if next_state in closed:
+                    continue
+
+                next_cost = g + move_costs[empty, m]
+                if next_state in costs and costs[next_state] <= next_cost:
+                    continue
+
+                next_heuristic = -1
+                for k in range(goals.shape[0]):
+                    goal_h = 0
+                    for i in range(count):
+                        goal_h += tile_costs[k, i, (next_state >> (TILE_BITS * i)) & TILE_MASK]
+                    if next_heuristic == -1 or goal_h < next_heuristic:
+                        next_heuristic = goal_h
+
+                next_f = next_heuristic if greedy else next_cost + next_heuristic
+
+                costs[next_state] = next_cost
+                parents[next_state] = state
+                heapq.heappush(heap, (next_f, counter, next_state, next_cost, next_heuristic, tile_i))
+                counter += 1
+
+        path_len = 0
+        if found != -1:
+            path_len = 1
+            c = found
+            while c in parents:
+                c = parents[c]
+                path_len += 1
+
+        # Goal back to start
+        path = np.empty(path_len, np.int64)
+        path_g = np.empty(path_len, np.int64)
+        c = found
+        for i in range(path_len):
+            path[i] = c
+            path_g[i] = costs[c]
+            if c in parents:
+                c = parents[c]
+
+        # Closed set unpacked here, way cheaper than from Python
+        n_closed = len(closed_order)
+        searched_tiles = np.empty((n_closed, count), np.int64)
+        searched = np.empty((n_closed, 3), np.int64)  # f, g, h
+        for i in range(n_closed):
+            state = closed_order[i]
+            for t in range(count):
+                searched_tiles[i, t] = (state >> (TILE_BITS * t)) & TILE_MASK
+            searched[i, 0] = closed_f[i]
+            searched[i, 1] = closed[state]
+            searched[i, 2] = closed_h[i]
+
+        return path, path_g, searched_tiles, searched
+
+
+# Flat moves arrays of a dimension: for each empty tile index, the tile indexes it can swap with & their cost
+@lru_cache(maxsize=None)
+def _moves_arrays(dimension: Tuple[int, int]) -> Tuple[Any, Any, Any]:
+    moves = flat_moves_table(dimension)
+    count = len(moves)
+
+    max_moves = max(len(m) for m in moves)
+    move_counts = np.zeros(count, np.int64)
+    move_tiles = np.zeros((count, max_moves), np.int64)
+    move_costs = np.zeros((count, max_moves), np.int64)
+    for pos, pos_moves in enumerate(moves):
+        move_counts[pos] = len(pos_moves)
+        for m, (cost, tile_i) in enumerate(pos_moves):
+            move_tiles[pos, m] = tile_i
+            move_costs[pos, m] = cost
+
+    return move_counts, move_tiles, move_costs
+
+
+def _zero_tile_costs(goal: Puzzle) -> Tuple[Tuple[int, ...], ...]:
+    count = len(goal.get_internal_state())
+    return tuple((0,) * count for _ in range(count))
+
+
+def _jit_solve(current: Puzzle, goal_states: List[Puzzle],
+               tile_costs_func: Callable[[Puzzle], Tuple[Tuple[int, ...], ...]], greedy: bool) -> SolverResult:
+    dimension = current.get_dimensions()
+    count = dimension[0] * dimension[1]
+    move_counts, move_tiles, move_costs = _moves_arrays(dimension)
+
+    goals = np.array([pack(g.get_internal_state()) for g in goal_states], np.int64)
+    tile_costs = np.array([tile_costs_func(g) for g in goal_states], np.int64)
+    x, y = current.get_current_pos()
+
+    path, path_g, searched_tiles, searched = _astar_kernel(pack(current.get_internal_state()), y * dimension[0] + x,
+                                                           goals, count, move_counts, move_tiles, move_costs,
+                                                           tile_costs, greedy)
+
+    closed_states_set = {}
+    for tiles, node in zip(searched_tiles.tolist(), searched.tolist()):
+        closed_states_set[Puzzle.from_state(tuple(tiles), dimension)] = tuple(node)
+
+    if len(path) == 0:
+        return None, None
+
+    # Back in the solvers' steps format: (state, move cost, tile moved)
+    states = [Puzzle.from_state(unpack(s, count), dimension) for s in reversed(path.tolist())]
+    costs = list(reversed(path_g.tolist()))
+    steps = [(states[0], 0, 0)]  # Initial state
+    for i in range(1, len(states)):
+        prev_x, prev_y = states[i - 1].get_current_pos()
+        steps.append((states[i], costs[i] - costs[i - 1], states[i][(prev_x, prev_y)]))
+
+    return steps, closed_states_set
+
+
+def can_accelerate(solver, current: ISolvable, heuristic_func) -> bool:
+    return (NUMBA_AVAILABLE and isinstance(current, Puzzle) and solver._perimeter_for(heuristic_func) is None
+            and solver._upper_bound is None and len(current.get_internal_state()) <= MAX_TILES)
+
+
+# Drop-in replacements of the solvers, falling back to them whenever the kernel can't be used
+class JitAStar(AStar):
+
+    def solve(self, current: ISolvable, goal_states: List[ISolvable],
+              heuristic_func: Callable[[ISolvable, ISolvable], int]):
+        if can_accelerate(self, current, heuristic_func) and heuristic_func in TILE_COSTS:
+            return _jit_solve(current, goal_states, TILE_COSTS[heuristic_func], False)
+        return super().solve(current, goal_states, heuristic_func)
+
+
+class JitGBFS(GBFS):
+
+    def solve(self, current: ISolvable, goal_states: List[ISolvable],
+              heuristic_func: Callable[[ISolvable, ISolvable], int]):
+        if can_accelerate(self, current, heuristic_func) and heuristic_func in TILE_COSTS:
+            return _jit_solve(current, goal_states, TILE_COSTS[heuristic_func], True)
+        return super().solve(current, goal_states, heuristic_func)
+
+
+class JitUCS(UCS):
+
+    def solve(self, current: ISolvable, goal_states: List[ISolvable],
+              heuristic_func: Callable[[ISolvable, ISolvable], float]):
+        # Heuristic is ignored by UCS
+        if can_accelerate(self, current, heuristic_func):
+            return _jit_solve(current, goal_states, _zero_tile_costs, False)
+        return super().solve(current, goal_states, heuristic_func)
@@ -0,0 +1,194 @@
+import heapq
+import threading
+import time
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from puzzle import Puzzle, flat_moves_table
+from solvers import Solver
+
+StateKey = Tuple[int, ...]
+BackwardEntry = Tuple[int, StateKey]  # Exact cost to goal, Next state toward goal
+
+
+class BackwardSearch:
+    """Uniform cost search from all goals at once, walking moves in reverse.
+    Can be paused after any settled state and resumed later: every settled state has its exact cost-to-goal."""
+
+    def __init__(self, goals: Tuple[Puzzle, ...]) -> None:
+        self._dimensions = goals[0].get_dimensions()
+        self._goals = [g.to_tuple() for g in goals]
+        self._index: Dict[StateKey, BackwardEntry] = {}
+
+        # Goals point to themselves
+        self._heap = [(0, g, g) for g in self._goals]
+        heapq.heapify(self._heap)
+        self._predecessors = self.__predecessor_moves()
+
+    def __predecessor_moves(self) -> List[List[Tuple[int, int]]]:
+        # Moves are not symmetric (diagonals only start from corners), so list for each empty tile
+        # position which empty tile positions could have moved a tile into it, and for what cost.
+        moves = flat_moves_table(self._dimensions)
+        predecessors: List[List[Tuple[int, int]]] = [[] for _ in moves]
+
+        for pos, pos_moves in enumerate(moves):
+            for cost, tile_i in pos_moves:
+                predecessors[tile_i].append((pos, cost))
+
+        return predecessors
+
+    def _settle_next(self) -> Optional[StateKey]:
+        # Settle the next closest state to the goals, None once the whole space is settled
+        index, heap = self._index, self._heap
+        while heap:
+            cost, key, next_key = heapq.heappop(heap)
+            if key in index:
+                continue
+
+            index[key] = (cost, next_key)
+
+            empty_pos = key.index(0)
+            for prev_pos, move_cost in self._predecessors[empty_pos]:
+                prev = list(key)
+                prev[empty_pos], prev[prev_pos] = prev[prev_pos], 0
+                prev = tuple(prev)
+                if prev not in index:
+                    heapq.heappush(heap, (cost + move_cost, prev, key))
+
+            return key
+
+        return None
+
+    def _next_cost(self):
+        # Smallest cost-to-goal any unsettled state can have
+        heap = self._heap
+        while heap and heap[0][1] in self._index:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else float('inf')
+
+    def cost(self, state: Puzzle) -> Optional[int]:
+        entry = self._index.get(state.to_tuple())
+        return None if entry is None else entry[0]
+
+    def steps_to_goal(self, state: Puzzle) -> List[Tuple[Puzzle, int, int]]:
+        # Follow the settled path from a state to its goal, in the solvers' steps format
+        steps = []
+        c = state
+        cost, next_key = self._index[c.to_tuple()]
+        while cost > 0:
+            for move in c.get_moves():
+                n = c.compute_move(c, move)
+                next_cost = self.cost(n)
+                if n.to_tuple() == next_key and next_cost + move[0] == cost:
+                    steps.append((n, move[0], c[move[1]]))
+                    c = n
+                    cost, next_key = self._index[next_key]
+                    break
+            else:
+                raise Exception("Backward search index is inconsistent with the puzzle moves.")
+
+        return steps
+
+    def __contains__(self, state: Puzzle) -> bool:
+        return state.to_tuple() in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class OrderedBackwardSearch(BackwardSearch):
+    """Backward search remembering the order states were settled in."""
+
+    def __init__(self, goals: Tuple[Puzzle, ...]) -> None:
+        super().__init__(goals)
+        self._settled: List[StateKey] = []  # Only ever appended to
+        self._positions: Dict[StateKey, int] = {}
+
+    def _settle_next(self) -> Optional[StateKey]:
+        key = super()._settle_next()
+        if key is not None:
+            self._positions[key] = len(self._settled)
+            self._settled.append(key)
+        return key
+
+
+class SettledStates(Mapping):
+    """Read-only view of the states a backward search settled up to (and including) a puzzle,
+    with their cost to goal. Puzzles are only created when iterated."""
+
+    def __init__(self, search: OrderedBackwardSearch, puzzle: Puzzle) -> None:
+        self.__search = search
+        self.__dimensions = puzzle.get_dimensions()
+        self.__count = search._positions[puzzle.to_tuple()] + 1
+
+    def __getitem__(self, state: Puzzle) -> Tuple[int, int, int]:
+        # Settled after the puzzle: not part of its search
+        position = self.__search._positions.get(state.to_tuple())
+        if position is None or position >= self.__count:
+            raise KeyError(state)
+
+        cost = self.__search.cost(state)
+        return cost, cost, 0
+
+    def __iter__(self) -> Iterator[Puzzle]:
+        # Settle order list is only appended to, so its first states stay the same if the search is resumed meanwhile
+        for key in self.__search._settled[:self.__count]:
+            yield Puzzle.from_state(key, self.__dimensions)
+
+    def __len__(self) -> int:
+        return self.__count
+
+
+# Uniform Cost Search for many puzzles sharing the same goals
+class BatchUCS(Solver):
+    """Solves puzzles from one backward search per set of goals, kept between calls:
+    it only resumes when a puzzle further away than all the previous ones shows up."""
+
+    def __init__(self, timeout: float = None) -> None:
+        super().__init__()
+        self.__timeout = timeout  # Seconds a call can spend settling states, unbounded if None
+        self.__searches: Dict[Tuple[StateKey, ...], OrderedBackwardSearch] = {}
+        self.__lock = threading.Lock()  # Timed out solves keep running in their thread
+
+    def __search_for(self, goal_states: List[Puzzle]) -> OrderedBackwardSearch:
+        key = tuple(g.to_tuple() for g in goal_states)
+        if key not in self.__searches:
+            self.__searches[key] = OrderedBackwardSearch(tuple(goal_states))
+        return self.__searches[key]
+
+    def solve_batch(self, puzzles: List[Puzzle], goal_states: List[Puzzle]) -> \
+            List[Tuple[List[Tuple[Puzzle, int, int]], Mapping]]:
+        with self.__lock:
+            search = self.__search_for(goal_states)
+
+            # Resume until every puzzle of the batch is settled, or out of time: those left are unsolved
+            deadline = None if self.__timeout is None else time.monotonic() + self.__timeout
+            pending = {p.to_tuple() for p in puzzles if p not in search}
+            settled = 0
+            while pending:
+                key = search._settle_next()
+                if key is None:
+                    break
+                pending.discard(key)
+
+                settled += 1
+                if deadline is not None and settled % 1024 == 0 and time.monotonic() > deadline:
+                    break
+
+            results = []
+            for p in puzzles:
+                if p not in search:
+                    results.append((None, None))
+                    continue
+
+                steps = [(p, 0, 0)] + search.steps_to_goal(p)  # Initial state first
+                results.append((steps, SettledStates(search, p)))
+
+            return results
+
+    def solve(self, current: Puzzle, goal_states: List[Puzzle], heuristic_func=None):
+        return self.solve_batch([current], goal_states)[0]
+
+    def f(self, g, h):
+        # Search by: total cost from the goals to node n
+        return g
@@ -0,0 +1,47 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Cold start: every run is a fresh interpreter, as when solving one short puzzle job at a time
+def time_runs(command, runs):
+    timings = []
+    for _ in range(runs):
+        t_start = time.monotonic()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.monotonic() - t_start)
+    return timings
+
+
+def report(name, timings):
+    print(f"<| {name} |>")
+    print(f"Min: {min(timings):.4f}s")
+    print(f"Median: {statistics.median(timings):.4f}s")
+    print(f"Average: {statistics.mean(timings):.4f}s ({len(timings)} runs)\n")
+
+
+def main(args):
+    python = sys.executable
+
+    report("Interpreter only", time_runs([python, "-c", "pass"], args.runs))
+    report("Import main", time_runs([python, "-c", "import main"], args.runs))
+    report(f"main.py {args.input_file}",
+           time_runs([python, "main.py", args.input_file, "-o", args.output], args.runs))
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Measures cold-start time of the puzzle solver.')
+
+    arg_parser.add_argument('input_file', metavar='input_file', type=str, nargs='?', default="in/sample.txt",
+                            help='Path to the puzzle(s) definition(s) file to solve. Default: in/sample.txt')
+
+    arg_parser.add_argument("-n", "--runs", type=int, default=10,
+                            help="Number of fresh processes to time for each command. Default: 10")
+
+    arg_parser.add_argument("-o", "--output", metavar="<output>", type=str,
+                            help="Output directory of the solved puzzles. Default: _out/",
+                            default="_out/")
+
+    main(arg_parser.parse_args())
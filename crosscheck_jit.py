@@ -0,0 +1,70 @@
+import argparse
+import json
+import sys
+import time
+
+from accelerated import NUMBA_AVAILABLE, JitAStar, JitGBFS, JitUCS
+from heuristics import h1, h2
+from puzzle import *
+from solvers import *
+
+
+def main(args):
+    if not NUMBA_AVAILABLE:
+        print("Numba is not installed, accelerated solvers are the pure-Python ones: nothing to cross-check.")
+        return 0
+
+    puzzles = load_puzzles(args.input_file, json.loads(args.dimensions))
+
+    # (Name, Pure-Python solver, Accelerated solver, Heuristic)
+    pairs = [
+        ("UCS", UCS(), JitUCS(), lambda current, goal: 0),
+        ("GBFS-h1", GBFS(), JitGBFS(), h1),
+        ("GBFS-h2", GBFS(), JitGBFS(), h2),
+        ("AStar-h1", AStar(), JitAStar(), h1),
+        ("AStar-h2", AStar(), JitAStar(), h2)
+    ]
+
+    # Compiles the kernel before timing anything
+    JitUCS().solve(puzzles[0], list(find_goals(puzzles[0])), None)
+
+    mismatches = 0
+    for name, solver, jit_solver, h_func in pairs:
+        elapsed, jit_elapsed = 0, 0
+        for i, p in enumerate(puzzles):
+            goals = list(find_goals(p))
+
+            t_start = time.monotonic()
+            steps, visited = solver.solve(p, goals, h_func)
+            elapsed += time.monotonic() - t_start
+
+            t_start = time.monotonic()
+            jit_steps, jit_visited = jit_solver.solve(p, goals, h_func)
+            jit_elapsed += time.monotonic() - t_start
+
+            cost, jit_cost = solution_cost(steps), solution_cost(jit_steps)
+            if cost != jit_cost or len(visited) != len(jit_visited):
+                mismatches += 1
+                print(f"Mismatch on puzzle {i} with {name}: cost {cost} vs {jit_cost}, "
+                      f"search length {len(visited)} vs {len(jit_visited)}.")
+
+        print(f"{name}: {elapsed:.4f}s pure-Python, {jit_elapsed:.4f}s accelerated ({len(puzzles)} puzzles)")
+
+    print(f"\n{mismatches} mismatch(es).")
+    return 1 if mismatches > 0 else 0
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Checks the accelerated solvers find the same solution costs '
+                                                     'as the pure-Python ones.')
+
+    arg_parser.add_argument('input_file', metavar='input_file', type=str, nargs='?',
+                            default="generated_puzzles_benchmark.txt",
+                            help='Path to the puzzle(s) definition(s) file to use. '
+                                 'Default: generated_puzzles_benchmark.txt')
+
+    arg_parser.add_argument("-d", "--dimensions", metavar="<[width, height]>", type=str,
+                            help="2D dimensions of the input puzzle. Default: [4, 2]",
+                            default="[4, 2]")
+
+    sys.exit(main(arg_parser.parse_args()))
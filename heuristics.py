@@ -1,8 +1,12 @@
 import math
-import numpy as np
+from functools import lru_cache
+from typing import Tuple
+
 from puzzle import Puzzle
+from solvers import admissible
 
 
+@admissible
 def h0(current: Puzzle, goal: Puzzle) -> int:
     dim = current.get_dimensions()
     pos = current.get_current_pos()
@@ -11,16 +15,16 @@ def h0(current: Puzzle, goal: Puzzle) -> int:
     return 1
 
 
-def h1(current: Puzzle, goal: Puzzle) -> int:
-    # Manhattan Distance, will toroidal consideration
-    total = 0
-    dim = current.get_dimensions()
+# Distance of every tile value from every position, computed once for each dimension & goal
+@lru_cache(maxsize=None)
+def _h1_table(dim: Tuple[int, int], is_hor_goal: bool) -> Tuple[Tuple[int, ...], ...]:
     count = dim[0] * dim[1]
-    is_hor_goal = goal[(1, 0)] == 2  # To speed of function computation and use goal state assumption (2 goals only)
+    table = []
 
-    for x in range(dim[0]):
-        for y in range(dim[1]):
-            v = current[(x, y)]
+    for i in range(count):
+        x, y = i % dim[0], i // dim[0]
+        row = []
+        for v in range(count):
             shifted_v = (v - 1) % count  # Value-1, wrapped if needed
             if is_hor_goal:
                 expected_x = shifted_v % dim[0]
@@ -33,7 +37,21 @@ def h1(current: Puzzle, goal: Puzzle) -> int:
             diff_y = abs(expected_y - y)
             calc_diff_x = math.ceil(diff_x / 2) if diff_x > math.ceil(dim[0] / 2) else diff_x
             calc_diff_y = math.ceil(diff_y / 2) if diff_y > math.ceil(dim[1] / 2) else diff_y
-            total += calc_diff_x + calc_diff_y
+            row.append(calc_diff_x + calc_diff_y)
+
+        table.append(tuple(row))
+
+    return tuple(table)
+
+
+def h1(current: Puzzle, goal: Puzzle) -> int:
+    # Manhattan Distance, will toroidal consideration
+    is_hor_goal = goal[(1, 0)] == 2  # To speed of function computation and use goal state assumption (2 goals only)
+    table = _h1_table(current.get_dimensions(), is_hor_goal)
+
+    total = 0
+    for i, v in enumerate(current.get_internal_state()):
+        total += table[i][v]
 
     return total
 
@@ -43,7 +61,18 @@ def h2(current: Puzzle, goal: Puzzle) -> int:
     # Ex: Tile should have 6, but has 4 => 6-4
     grid1 = current.get_internal_state()
     grid2 = goal.get_internal_state()
-    sub = np.subtract(grid1, grid2)
-    diff = np.abs(sub)
-    x = np.sum(diff.flatten())
-    return x
+    return sum(abs(a - b) for a, b in zip(grid1, grid2))
+
+
+# Cost of each tile value at each position, for solvers working on tables instead of Puzzle objects.
+# Only additive heuristics (sum over positions) can be expressed this way.
+def h1_tile_costs(goal: Puzzle) -> Tuple[Tuple[int, ...], ...]:
+    return _h1_table(goal.get_dimensions(), goal[(1, 0)] == 2)
+
+
+def h2_tile_costs(goal: Puzzle) -> Tuple[Tuple[int, ...], ...]:
+    count = len(goal.get_internal_state())
+    return tuple(tuple(abs(v - g) for v in range(count)) for g in goal.get_internal_state())
+
+
+TILE_COSTS = {h1: h1_tile_costs, h2: h2_tile_costs}
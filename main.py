@@ -7,9 +7,12 @@ from concurrent.futures.thread import ThreadPoolExecutor
 
 from helpers import *
 from heuristics import h0, h1, h2
+from backward import BatchUCS
+from perimeter import Perimeter
 from puzzle import *
 from solvers import *
-import numpy as np
+
+PERIMETER_CACHE_DIR = "_cache/"
 
 
 def generate_rand_puzzles(n, dimensions):
@@ -20,8 +23,7 @@ def generate_rand_puzzles(n, dimensions):
 
     lines = []
     for i in range(n):
-        lin = np.arange(dimensions[0] * dimensions[1])
-        puzzle_arr = lin.tolist()
+        puzzle_arr = list(range(dimensions[0] * dimensions[1]))
         random.shuffle(puzzle_arr)
         lines.append(" ".join(list(map(str, puzzle_arr))) + "\n")
 
@@ -43,18 +45,100 @@ def retrace_steps(search_graph: Dict[Puzzle, Tuple[Puzzle, Any]], final_state: P
     return steps
 
 
+def solve_with_portfolio(puzzles: List[Puzzle], out_dir: str, portfolio: 'Portfolio'):
+    all_metrics = []
+    for i, p in enumerate(puzzles):
+        print("===============")
+        print("Will solve puzzle:")
+        print(p)
+        print("Solving with portfolio...")
+
+        result = portfolio.solve(p, list(find_goals(p)))
+        all_metrics.append(result)
+        out_sol_file = f"./{out_dir}{i}_portfolio_solution.txt"
+
+        if result["steps"] is None:
+            print("Failed to find solution...")
+            with open(out_sol_file, 'w') as sol_file:
+                sol_file.write("no solution")
+            continue
+
+        print(f"First solution in {result['time_to_first']:.4f} seconds.")
+        if result["time_to_optimal"] is None:
+            print(f"Could not prove optimal in 60sec, best cost {result['total_cost']} found by {result['solver']}.")
+            elapsed = result["time_to_first"]
+        else:
+            print(f"Optimal in {result['time_to_optimal']:.4f} seconds, cost {result['total_cost']} "
+                  f"found by {result['solver']}.")
+            elapsed = result["time_to_optimal"]
+
+        # Solution output file
+        with open(out_sol_file, 'w') as sol_file:
+            for state, move_cost, tile_moved in result["steps"]:
+                sol_file.write(f"{tile_moved} {str(move_cost)} {state.to_single_line_str()}\n")
+            sol_file.write(f"{result['total_cost']} {elapsed:.4f}")
+
+        print(f"Solution at '{out_sol_file}'.")
+
+    print("\n\n\n>>>>>>>>>>>>>>>>>")
+    print("Metrics >>>>>>>>>")
+    print(">>>>>>>>>>>>>>>>>\n")
+
+    metrics = {
+        "Time To First Solution": "time_to_first",
+        "Time To Optimal": "time_to_optimal",
+        "Total Cost": "total_cost"
+    }
+
+    for metric_display_name in metrics:
+        metric = metrics[metric_display_name]
+        group = [m[metric] for m in all_metrics if m[metric] is not None]
+        group_count = len(group)
+        group_sum = sum(group)
+
+        print(f"<| {metric_display_name} |>")
+        print(f"Total: {group_sum}")
+        if group_count > 0:
+            print(f"Average: {group_sum / group_count} ({group_sum} / {group_count})")
+        print()
+
+    # Who found the best solutions
+    for name in sorted({m["solver"] for m in all_metrics if m["solver"] is not None}):
+        count = len([m for m in all_metrics if m["solver"] == name])
+        print(f"Best found by {name}: {count} / {len(all_metrics)}")
+
+
 def main(args):
     gen, in_file, out_dir, dimensions = args.generate, args.input_file, args.output, json.loads(args.dimensions)
+    perimeter_mb, jit, batch, portfolio, race = args.perimeter, args.jit, args.batch, args.portfolio, args.race
 
     if len(dimensions) < 2:
         raise ValueError("Invalid dimensions given.")
 
+    # Compiled & batch solvers can't prune with the portfolio's shared cost
+    if (portfolio or race) and (jit or batch):
+        raise ValueError("Portfolio can't be combined with the compiled (-j) or batch (-b) solvers.")
+
+    # Batch UCS reads its solutions from its own backward search
+    if batch and (jit or perimeter_mb > 0):
+        raise ValueError("Batch UCS (-b) can't be combined with the compiled solvers (-j) or a perimeter (-p).")
+
     if gen > 0:
         generate_rand_puzzles(gen, dimensions)
 
     create_dir(out_dir)
     puzzles = load_puzzles(in_file, dimensions)
 
+    # Goal-side perimeter, shared by every puzzle of the same dimension
+    perimeter = None
+    if perimeter_mb > 0 and len(puzzles) > 0:
+        create_dir(PERIMETER_CACHE_DIR)
+        print("Loading perimeter...")
+        perimeter = Perimeter.load_or_build(find_goals(puzzles[0]), Perimeter.states_for_memory(perimeter_mb),
+                                            PERIMETER_CACHE_DIR)
+        print(f"Perimeter of {len(perimeter)} states, cost to goal of any other state is at least "
+              f"{perimeter.get_bound()}.")
+
     # Solvers with each heuristics
     demo_heuristics_func_set = {"h0": h0}
     heuristics_func_set = {"h1": h1, "h2": h2}
@@ -62,12 +146,26 @@ def main(args):
 
     # heuristics_func_set = best
 
+    if portfolio or race:
+        # Imported only when asked: pulls in multiprocessing
+        from portfolio import Portfolio, default_strategies
+        solve_with_portfolio(puzzles, out_dir, Portfolio(default_strategies(heuristics_func_set, perimeter), race))
+        return
+
+    ucs_cls, gbfs_cls, astar_cls = UCS, GBFS, AStar
+    if jit:
+        # Imported only when asked: pulls in Numba & NumPy
+        from accelerated import NUMBA_AVAILABLE, JitAStar, JitGBFS, JitUCS
+        if not NUMBA_AVAILABLE:
+            print("Numba is not installed, using the pure-Python solvers.")
+        ucs_cls, gbfs_cls, astar_cls = JitUCS, JitGBFS, JitAStar
+
     solvers = {
-        "UCS": (UCS(), {
+        "UCS": (BatchUCS(timeout=60) if batch else ucs_cls(perimeter), {
             "default": lambda current, goal: 0
         }),
-        "GBFS": (GBFS(), heuristics_func_set),
-        "AStar": (AStar(), heuristics_func_set)
+        "GBFS": (gbfs_cls(), heuristics_func_set),
+        "AStar": (astar_cls(perimeter), heuristics_func_set)
     }
 
     executor = ThreadPoolExecutor(max_workers=2)
@@ -104,6 +202,9 @@ def main(args):
                 except concurrent.futures.TimeoutError as e:
                     future.cancel()
                     print(f"Could not find solution in 60sec.")
+
+                # Timed out, or the search ended without one
+                if steps_to_goal is None:
                     print("Failed to find solution...")
                     with open(out_sol_file, 'w') as sol_file:
                         sol_file.write("no solution")
@@ -192,7 +293,8 @@ def main(args):
 
     print("\n\n")
 
-    # Other numerical metrics
+    # Other numerical metrics, of solved runs only
+    solved_metrics = [m for m in all_metrics if 'no_sol' not in m]
     metrics = {
         # "No Solution": [m for m in all_metrics if 'no_sol' in m],
         "Solution Length": "solution_length",
@@ -203,9 +305,11 @@ def main(args):
 
     for metric_display_name in metrics:
         metric = metrics[metric_display_name]
-        group = [m[metric] for m in all_metrics]
+        group = [m[metric] for m in solved_metrics]
         group_count = len(group)
         group_sum = sum(group)
+        if group_count == 0:
+            continue
 
         print(f"<| {metric_display_name} |>")
         print(f"Total: {group_sum}")
@@ -213,7 +317,7 @@ def main(args):
 
         # By solver
         for s_name in solvers:
-            s_group = [m[metric] for m in all_metrics if "solver" in m and m["solver"] == s_name]
+            s_group = [m[metric] for m in solved_metrics if "solver" in m and m["solver"] == s_name]
             s_group_sum = sum(s_group)
             if len(s_group) == 0:
                 continue
@@ -222,7 +326,7 @@ def main(args):
 
         # By Heuristic
         for h_name in h_names:
-            h_group = [m[metric] for m in all_metrics if
+            h_group = [m[metric] for m in solved_metrics if
                        "heuristic_function" in m and m["heuristic_function"] == h_name]
             h_group_sum = sum(h_group)
             if len(h_group) == 0:
@@ -233,7 +337,7 @@ def main(args):
         # By solver -> Heuristic
         for s_name in solvers:
             for h_name in h_names:
-                s_group = [m[metric] for m in all_metrics if ("solver" in m and m["solver"] == s_name) and (
+                s_group = [m[metric] for m in solved_metrics if ("solver" in m and m["solver"] == s_name) and (
                             "heuristic_function" in m and m["heuristic_function"] == h_name)]
                 s_group_sum = sum(s_group)
                 if len(s_group) == 0:
@@ -268,6 +372,25 @@ if __name__ == "__main__":
                             help="Output directory relative to current working directory. Default: _out/",
                             default="_out/")
 
+    arg_parser.add_argument("-p", "--perimeter", metavar="<megabytes>", type=float, default=0,
+                            help="Memory limit of the goal-side perimeter used by UCS & AStar (admissible heuristics "
+                                 f"only), cached in {PERIMETER_CACHE_DIR}. Default: 0 (no perimeter)")
+
+    arg_parser.add_argument("-j", "--jit", action="store_true",
+                            help="Solve with the Numba compiled search when installed, and the heuristic & puzzle "
+                                 "size allow it.")
+
+    arg_parser.add_argument("-b", "--batch", action="store_true",
+                            help="Solve all the puzzles with UCS at once, from one search backward from the goals.")
+
+    arg_parser.add_argument("--portfolio", action="store_true",
+                            help="Run all the solvers on each puzzle as a group, UCS & AStar pruning anything "
+                                 "costlier than the best solution found so far.")
+
+    arg_parser.add_argument("--race", action="store_true",
+                            help="Portfolio with each solver in its own process, cancelled once UCS proves the "
+                                 "best solution optimal.")
+
     args = arg_parser.parse_args()
 
     main(args)
@@ -0,0 +1,67 @@
+import os
+import pickle
+from typing import Tuple
+
+from backward import BackwardSearch
+from puzzle import Puzzle
+
+# Rough footprint of one index entry (dict slot + key tuple + value tuple), used to size the index.
+# Only the index is kept: building it briefly needs several times that for the search frontier.
+BYTES_PER_ENTRY = 256
+
+
+class Perimeter(BackwardSearch):
+    """Index of every state within a cost radius of the goals, with their exact cost-to-goal.
+    Built once per dimension with a backward uniform cost search from all goals at once."""
+
+    def __init__(self, goals: Tuple[Puzzle, ...], max_states: int) -> None:
+        if max_states < 1:
+            raise ValueError("Perimeter needs room for at least one state.")
+
+        super().__init__(goals)
+        self.__max_states = max_states
+        self.__bound = 0  # Smallest cost-to-goal any state outside of the index can have
+
+    @staticmethod
+    def states_for_memory(megabytes: float) -> int:
+        return max(1, int(megabytes * 1024 * 1024 / BYTES_PER_ENTRY))
+
+    @classmethod
+    def load_or_build(cls, goals: Tuple[Puzzle, ...], max_states: int, cache_dir: str) -> '__class__':
+        w, h = goals[0].get_dimensions()
+        path = os.path.join(cache_dir, f"perimeter_{w}x{h}_{max_states}.pkl")
+
+        perimeter = cls(goals, max_states)
+        if os.path.isfile(path):
+            perimeter.load(path)
+        else:
+            perimeter.build()
+            perimeter.save(path)
+
+        return perimeter
+
+    def build(self) -> None:
+        # Costs are settled in order: everything cheaper than the next one is already indexed
+        while len(self._index) < self.__max_states and self._settle_next() is not None:
+            pass
+
+        # Frontier only served to find the bound, the index can't be extended further either way
+        self.__bound = self._next_cost()
+        self._heap = []
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            pickle.dump((self._dimensions, self._goals, self.__bound, self._index), file)
+
+    def load(self, path: str) -> None:
+        with open(path, "rb") as file:
+            dimensions, goals, bound, index = pickle.load(file)
+
+        if tuple(dimensions) != tuple(self._dimensions) or goals != self._goals:
+            raise ValueError(f"Perimeter file '{path}' was built for other goals.")
+
+        # Loaded index can't be extended further
+        self.__bound, self._index, self._heap = bound, index, []
+
+    def get_bound(self):
+        return self.__bound
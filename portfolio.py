@@ -0,0 +1,154 @@
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from puzzle import Puzzle
+from solvers import AStar, GBFS, UCS, solution_cost
+
+# Name, Solver, Solver arguments, Heuristic, Proves optimal
+Strategy = Tuple[str, type, Dict[str, Any], Optional[Callable[[Puzzle, Puzzle], int]], bool]
+
+
+class Incumbent:
+    """Cost of the best solution published so far by the solvers of a portfolio, and their cancellation.
+    Shared between threads & processes."""
+
+    def __init__(self) -> None:
+        self.__cost = multiprocessing.Value('d', float('inf'))
+        self.__cancelled = multiprocessing.Event()
+
+    def publish(self, cost: float) -> bool:
+        with self.__cost.get_lock():
+            if cost >= self.__cost.value:
+                return False
+            self.__cost.value = cost
+            return True
+
+    def get_cost(self) -> float:
+        return self.__cost.value
+
+    def cancel(self) -> None:
+        self.__cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self.__cancelled.is_set()
+
+
+def default_strategies(heuristics_func_set: Dict[str, Callable[[Puzzle, Puzzle], int]],
+                       perimeter=None) -> List[Strategy]:
+    # Fast greedy searches first for an early incumbent, then the ones it lets prune, UCS proving the optimal
+    strategies = [(f"GBFS-{h_name}", GBFS, {}, h_func, False) for h_name, h_func in heuristics_func_set.items()]
+    strategies += [(f"AStar-{h_name}", AStar, {"perimeter": perimeter}, h_func, False)
+                   for h_name, h_func in heuristics_func_set.items()]
+    strategies.append(("UCS", UCS, {"perimeter": perimeter}, None, True))
+    return strategies
+
+
+def _run_strategy(strategy: Strategy, puzzle: Puzzle, goals: List[Puzzle], incumbent: Incumbent,
+                  results: multiprocessing.Queue) -> None:
+    # Race worker: publishes right away so the other processes prune with it
+    name, solver_cls, solver_args, h_func, proves_optimal = strategy
+    steps, _ = solver_cls(upper_bound=incumbent, **solver_args).solve(puzzle, goals, h_func)
+    if steps is not None:
+        incumbent.publish(solution_cost(steps))
+
+    results.put((name, steps, proves_optimal and not incumbent.is_cancelled()))
+
+
+class Portfolio:
+    """Runs several solvers on a puzzle as a group sharing the best solution cost found (branch & bound).
+    Sequentially, or racing in separate processes until a solver proves the best solution optimal."""
+
+    def __init__(self, strategies: List[Strategy], race: bool = False, timeout: float = 60) -> None:
+        self.__strategies = strategies
+        self.__race = race
+        self.__timeout = timeout
+
+    def solve(self, puzzle: Puzzle, goals: List[Puzzle]) -> Dict[str, Any]:
+        result = {
+            "steps": None,
+            "total_cost": None,
+            "solver": None,
+            "time_to_first": None,  # Seconds to first solution, if any
+            "time_to_optimal": None  # Seconds to the best solution proven optimal, if proven
+        }
+
+        if self.__race:
+            self.__solve_race(puzzle, goals, result)
+        else:
+            self.__solve_sequential(puzzle, goals, result)
+
+        return result
+
+    @staticmethod
+    def __record(result: Dict[str, Any], name: str, steps, elapsed: float) -> None:
+        if steps is None:
+            return
+
+        if result["time_to_first"] is None:
+            result["time_to_first"] = elapsed
+
+        cost = solution_cost(steps)
+        if result["total_cost"] is None or cost < result["total_cost"]:
+            result.update(steps=steps, total_cost=cost, solver=name)
+
+    def __solve_sequential(self, puzzle: Puzzle, goals: List[Puzzle], result: Dict[str, Any]) -> None:
+        incumbent = Incumbent()
+        timer = threading.Timer(self.__timeout, incumbent.cancel)
+        timer.start()
+        t_start = time.monotonic()
+
+        try:
+            for name, solver_cls, solver_args, h_func, proves_optimal in self.__strategies:
+                steps, _ = solver_cls(upper_bound=incumbent, **solver_args).solve(puzzle, goals, h_func)
+                if incumbent.is_cancelled():
+                    break
+
+                elapsed = time.monotonic() - t_start
+                self.__record(result, name, steps, elapsed)
+                if steps is not None:
+                    incumbent.publish(solution_cost(steps))
+
+                # Nothing cheaper than the incumbent left
+                if proves_optimal:
+                    result["time_to_optimal"] = elapsed
+                    break
+        finally:
+            timer.cancel()
+
+    def __solve_race(self, puzzle: Puzzle, goals: List[Puzzle], result: Dict[str, Any]) -> None:
+        incumbent = Incumbent()
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=_run_strategy, args=(s, puzzle, goals, incumbent, results),
+                                             daemon=True) for s in self.__strategies]
+
+        t_start = time.monotonic()
+        for p in processes:
+            p.start()
+
+        try:
+            proven = False
+            for _ in processes:
+                try:
+                    name, steps, proves = results.get(timeout=max(0, t_start + self.__timeout - time.monotonic()))
+                except queue.Empty:
+                    break
+
+                elapsed = time.monotonic() - t_start
+                self.__record(result, name, steps, elapsed)
+                proven = proven or proves
+
+                # Workers publish before sending their solution: once proven, wait for the published best one
+                best_cost = float('inf') if result["total_cost"] is None else result["total_cost"]
+                if proven and best_cost <= incumbent.get_cost():
+                    # Losers are cancelled
+                    result["time_to_optimal"] = elapsed
+                    break
+        finally:
+            incumbent.cancel()
+            for p in processes:
+                p.join(timeout=1)
+                if p.is_alive():
+                    p.terminate()
@@ -1,14 +1,93 @@
-import copy
+from functools import lru_cache
 from typing import List, Tuple
 from solvers import ISolvable
-import numpy as np
 
-PuzzleInternalState = np.ndarray
+PuzzleInternalState = Tuple[int, ...]  # Tiles, row major
 PuzzleTilePos = Tuple[int, int]
 IntDirection2D = Tuple[int, int]
 PuzzleMove = Tuple[int, PuzzleTilePos, IntDirection2D]  # Cost, TileToMove, Direction
 
 
+# Moves only depend on the dimension & empty tile position: computed once for each, then looked up
+@lru_cache(maxsize=None)
+def _moves_table(dimension: Tuple[int, int], pos: PuzzleTilePos) -> Tuple[PuzzleMove, ...]:
+    moves: List[PuzzleMove] = []
+    w, h = dimension
+    x, y = pos
+
+    def cost(tile: PuzzleTilePos) -> int:
+        # Wrapped Horizontally
+        if (w > 2) and ((tile[0] == 0 and x == w - 1) or (tile[0] == w - 1 and x == 0)):
+            return 2
+
+        # Wrapped Vertically
+        if (h > 2) and ((tile[1] == 0 and y == h - 1) or (tile[1] == h - 1 and y == 0)):
+            return 2
+
+        # Default: Regular
+        return 1
+
+    # Adjacent tiles (Regular [Cost: 1] & Wrapping [Cost: 2])
+    top = x, ((y - 1) % h)
+    right = ((x + 1) % w), y
+    bottom = x, ((y + 1) % h)
+    left = ((x - 1) % w), y
+
+    # No duplicate tiles if wrapped with Width or Height of 2
+    laterals = []
+    if top == bottom:
+        laterals.append((top, (0, -1)))
+    else:
+        laterals.append((top, (0, -1)))
+        laterals.append((bottom, (0, 1)))
+
+    if right == left:
+        laterals.append((right, (-1, 0)))
+    else:
+        laterals.append((right, (-1, 0)))
+        laterals.append((left, (1, 0)))
+
+    # Add with tile's cost
+    for t in laterals:
+        moves.append((cost(t[0]), t[0], t[1]))
+
+    # Diagonals
+    diagonals = []
+    if (h, w) != (2, 2):  # Don't consider 2x2 puzzles
+        d1, d2, dir1, dir2 = None, None, None, None
+        # Top left || Bottom Right
+        if (x, y) == (0, 0) or (x, y) == (w - 1, h - 1):
+            d1, dir1 = (((x - 1) % w), ((y - 1) % h)), (1, 1)
+            d2, dir2 = (((x + 1) % w), ((y + 1) % h)), (-1, -1)
+
+        # Top right || Bottom Left
+        if (x, y) == (w - 1, 0) or (x, y) == (0, h - 1):
+            d1, dir1 = (((x - 1) % w), ((y + 1) % h)), (1, -1)
+            d2, dir2 = (((x + 1) % w), ((y - 1) % h)), (-1, 1)
+
+        if d1 and d2:
+            diagonals.append((d1, dir1))
+            diagonals.append((d2, dir2))
+
+    # Add with tile's cost
+    for t in diagonals:
+        moves.append((3, t[0], t[1]))
+
+    # [(cost, (tile.x, tile.y), 2D_Direction), ...]
+    return tuple(moves)
+
+
+# Moves of every empty tile position by flat (row major) indexes: [[(cost, tile index), ...], ...]
+@lru_cache(maxsize=None)
+def flat_moves_table(dimension: Tuple[int, int]) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    w, h = dimension
+    table = []
+    for i in range(w * h):
+        moves = _moves_table(dimension, (i % w, i // w))
+        table.append(tuple((cost, tile_y * w + tile_x) for cost, (tile_x, tile_y), _ in moves))
+    return tuple(table)
+
+
 # Main Puzzle objects
 # Also represents a unique puzzle entire state
 class Puzzle(ISolvable):
@@ -21,25 +100,28 @@ class Puzzle(ISolvable):
         if len(dimension) < 2 or dimension[0] < 2 or dimension[1] < 2:
             raise ValueError("Invalid puzzle dimensions. Width & Height needs greater or equal than 2.")
 
-        self.__dimensions = dimension
+        self.__dimensions = (dimension[0], dimension[1])
         self.__grid = grid
         self.__tile_pos = empty_tile_position
 
     @classmethod
-    def from_state(cls, state: PuzzleInternalState, tile_pos: PuzzleTilePos = None) -> '__class__':
+    def from_state(cls, state: PuzzleInternalState, dimension: Tuple[int, int],
+                   tile_pos: PuzzleTilePos = None) -> '__class__':
         if tile_pos is None:
-            pos = Puzzle.locate_tile(state, 0)
+            pos = Puzzle.locate_tile(state, dimension[0], 0)
         else:
             pos = tile_pos
 
-        p = cls(state, (state.shape[1], state.shape[0]), pos)
+        p = cls(state, dimension, pos)
 
         return p
 
     @classmethod
     def from_int_list(cls, int_list: List[int], dimension: Tuple[int, int]) -> '__class__':
-        grid = np.reshape(int_list, (dimension[1], dimension[0]))
-        return cls.from_state(grid)
+        if len(int_list) != dimension[0] * dimension[1]:
+            raise ValueError(f"Puzzle definition of {len(int_list)} tiles does not fit in dimensions {dimension}.")
+
+        return cls.from_state(tuple(int(t) for t in int_list), dimension)
 
     def get_internal_state(self):
         return self.__grid
@@ -50,108 +132,37 @@ class Puzzle(ISolvable):
     def get_current_pos(self):
         return self.__tile_pos
 
+    def to_tuple(self) -> Tuple[int, ...]:
+        # Flat, hashable & picklable grid (row major)
+        return self.__grid
+
     # Puzzle have 2D coordinate system origin at top left of the image
     def __getitem__(self, pos: Tuple[int, int]) -> int:
-        return self.__grid[pos[1], pos[0]]
-
-    def __setitem__(self, key: Tuple[int, int], value) -> None:
-        self.__grid[key[1], key[0]] = value
+        return self.__grid[pos[1] * self.__dimensions[0] + pos[0]]
 
     @staticmethod
-    def locate_tile(state: PuzzleInternalState, tile: int) -> Tuple[int, int]:
-        x, y = 0, 0
-
-        for row in state:
-            for t in row:
-                if t == tile:
-                    return x, y
-                x += 1
-
-            y += 1
-            x = 0
+    def locate_tile(state: PuzzleInternalState, width: int, tile: int) -> Tuple[int, int]:
+        if tile not in state:
+            raise Exception(f"No tile marked as '{tile}' found in the puzzle definition.")
 
-        raise Exception(f"No tile marked as '{tile}' found in the puzzle definition.")
+        i = state.index(tile)
+        return i % width, i // width
 
     def get_moves(self) -> List[PuzzleMove]:
-        moves: List[PuzzleMove] = []
-        w, h = self.__dimensions
-        x, y = self.__tile_pos
-
-        def cost(tile: PuzzleTilePos) -> int:
-            # Wrapped Horizontally
-            if (w > 2) and ((tile[0] == 0 and x == w - 1) or (tile[0] == w - 1 and x == 0)):
-                return 2
-
-            # Wrapped Vertically
-            if (h > 2) and ((tile[1] == 0 and y == h - 1) or (tile[1] == h - 1 and y == 0)):
-                return 2
-
-            # Default: Regular
-            return 1
-
-        # Adjacent tiles (Regular [Cost: 1] & Wrapping [Cost: 2])
-        top = x, ((y - 1) % h)
-        right = ((x + 1) % w), y
-        bottom = x, ((y + 1) % h)
-        left = ((x - 1) % w), y
-
-        # No duplicate tiles if wrapped with Width or Height of 2
-        laterals = []
-        if top == bottom:
-            laterals.append((top, (0, -1)))
-        else:
-            laterals.append((top, (0, -1)))
-            laterals.append((bottom, (0, 1)))
-
-        if right == left:
-            laterals.append((right, (-1, 0)))
-        else:
-            laterals.append((right, (-1, 0)))
-            laterals.append((left, (1, 0)))
-
-        # Add with tile's cost
-        for t in laterals:
-            moves.append((cost(t[0]), t[0], t[1]))
-
-        # Diagonals
-        diagonals = []
-        if (h, w) != (2, 2):  # Don't consider 2x2 puzzles
-            d1, d2, dir1, dir2 = None, None, None, None
-            # Top left || Bottom Right
-            if (x, y) == (0, 0) or (x, y) == (w - 1, h - 1):
-                d1, dir1 = (((x - 1) % w), ((y - 1) % h)), (1, 1)
-                d2, dir2 = (((x + 1) % w), ((y + 1) % h)), (-1, -1)
-
-            # Top right || Bottom Left
-            if (x, y) == (w - 1, 0) or (x, y) == (0, h - 1):
-                d1, dir1 = (((x - 1) % w), ((y + 1) % h)), (1, -1)
-                d2, dir2 = (((x + 1) % w), ((y - 1) % h)), (-1, 1)
-
-            if d1 and d2:
-                diagonals.append((d1, dir1))
-                diagonals.append((d2, dir2))
-
-        # Add with tile's cost
-        for t in diagonals:
-            moves.append((3, t[0], t[1]))
-
-        # [(cost, (tile.x, tile.y), 2D_Direction), ...]
-        return moves
+        return list(_moves_table(self.__dimensions, self.__tile_pos))
 
     def compute_move(self, from_state: '__class__', move_to_apply: PuzzleMove) -> '__class__':
-        def swap(a, p1: PuzzleTilePos, p2: PuzzleTilePos):
-            # Tuple unpacking swap is more efficient
-            a[p1], a[p2] = a[p2], a[p1]
-
-        w, h = self.__dimensions
+        w = self.__dimensions[0]
         cost, tile_pos, direction = move_to_apply
-        tile_x, tile_y = tile_pos
-        new_empty_tile_pos = ((tile_x + direction[0]) % w), ((tile_y + direction[1]) % h)
+        tile_i = tile_pos[1] * w + tile_pos[0]
+        empty_x, empty_y = from_state.__tile_pos
+        empty_i = empty_y * w + empty_x
 
-        computed_state = copy.deepcopy(from_state)
-        swap(computed_state, tile_pos, new_empty_tile_pos)
+        # Moved tile takes the place of the empty tile
+        computed_state = list(from_state.__grid)
+        computed_state[tile_i], computed_state[empty_i] = computed_state[empty_i], computed_state[tile_i]
 
-        return Puzzle.from_state(computed_state.__grid, tile_pos)
+        return Puzzle(tuple(computed_state), self.__dimensions, tile_pos)
 
     def __eq__(self, o: object) -> bool:
         # Reference to same obj
@@ -162,41 +173,43 @@ class Puzzle(ISolvable):
             return False
 
         # Compare only internal state
-        return np.array_equal(self.__grid, o.__grid)
+        return self.__grid == o.__grid
 
     def __ne__(self, o: object) -> bool:
-        return not __eq__(o)
+        return not self.__eq__(o)
 
     def to_single_line_str(self):
-        str_l = []
-        for r in self.__grid.tolist():
-            for c in r:
-                str_l.append(str(c))
-        return " ".join(str_l)
+        return " ".join(map(str, self.__grid))
 
     def __str__(self) -> str:
-        return np.array_str(self.__grid)
+        # Same layout as a 2D array print
+        w, h = self.__dimensions
+        size = max(len(str(t)) for t in self.__grid)
+        rows = []
+        for y in range(h):
+            rows.append("[" + " ".join(str(t).rjust(size) for t in self.__grid[y * w:(y + 1) * w]) + "]")
+        return "[" + "\n ".join(rows) + "]"
 
     def __hash__(self):
-        return hash(str(self.__grid))
+        return hash(self.__grid)
 
 
 # ======
 def find_goals(puzzle: Puzzle) -> Tuple[Puzzle, Puzzle]:
     dim = puzzle.get_dimensions()
-    count = dim[0] * dim[1]
-    lin = np.arange(count)
-    lin = np.append(lin[1:], lin[0])  # 0 tile is last
+    w, h = dim
+    count = w * h
+    lin = tuple(range(1, count)) + (0,)  # 0 tile is last
 
-    goal1 = np.reshape(lin, (dim[1], dim[0]))
+    goal1 = lin
 
-    goal2 = np.reshape(lin, (dim[0], dim[1])).T
-    return Puzzle.from_state(goal1), Puzzle.from_state(goal2)
+    # Filled column by column
+    goal2 = tuple(lin[x * h + y] for y in range(h) for x in range(w))
+    return Puzzle.from_state(goal1, dim), Puzzle.from_state(goal2, dim)
 
 
 def parse_puzzle(p_list: list, dimension: Tuple[int, int]) -> Puzzle:
-    int_arr = np.array(p_list, dtype=np.uint32)
-    return Puzzle.from_int_list(list(int_arr), dimension)
+    return Puzzle.from_int_list(list(map(int, p_list)), dimension)
 
 
 def load_puzzles(puzzle_filename, dimension: Tuple[int, int]) -> List[Puzzle]:
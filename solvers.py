@@ -24,7 +24,30 @@ class ISolvable(metaclass=ABCMeta):
         pass
 
 
+# Heuristics never overestimating the cost to goal, declared with @admissible
+ADMISSIBLE_HEURISTICS = set()
+
+
+def admissible(heuristic_func: Callable[[ISolvable, ISolvable], int]) -> Callable[[ISolvable, ISolvable], int]:
+    ADMISSIBLE_HEURISTICS.add(heuristic_func)
+    return heuristic_func
+
+
+# Total cost of solution steps, as returned by the solvers
+def solution_cost(steps: List[Tuple[ISolvable, int, int]]) -> int:
+    return sum(move_cost for _, move_cost, _ in steps)
+
+
 class Solver(ABC):
+    # Searches can only stop on the best perimeter crossing when their priority is a lower bound of the solution cost
+    optimal = True
+
+    def __init__(self, perimeter=None, upper_bound=None) -> None:
+        # Optional goal-side index (see perimeter.Perimeter) giving exact cost-to-goal for states near the goals
+        self._perimeter = perimeter
+        # Optional solution cost found elsewhere & cancellation (see portfolio.Incumbent)
+        self._upper_bound = upper_bound
+
     # Retracing steps of solution backward in resulting search graph
     def _retrace_steps(self, search_graph: Dict[ISolvable, Tuple[ISolvable, Any]], final_state: ISolvable) -> List[
         Tuple[ISolvable, int, int]]:
@@ -39,6 +62,34 @@ class Solver(ABC):
         steps.reverse()
         return steps
 
+    # Path to the perimeter state, then along the perimeter index to the goal
+    def _retrace_perimeter_steps(self, search_graph: Dict[ISolvable, Tuple[ISolvable, Any]],
+                                 perimeter_state: ISolvable) -> List[Tuple[ISolvable, int, int]]:
+        return self._retrace_steps(search_graph, perimeter_state) + self._perimeter.steps_to_goal(perimeter_state)
+
+    # Perimeter used by a search: stopping on it early only keeps optimal solutions optimal when the priority is a
+    # lower bound of the solution cost, so with admissible heuristics only
+    def _perimeter_for(self, heuristic_func):
+        if not self.optimal or heuristic_func in ADMISSIBLE_HEURISTICS:
+            return self._perimeter
+        return None
+
+    def _should_stop(self, priority, incumbent) -> bool:
+        return incumbent is not None and (not self.optimal or priority >= incumbent[0])
+
+    # Current cost to beat, None once the search should give up: cancelled, or nothing left can beat the cost
+    def _bound(self, priority):
+        upper_bound = self._upper_bound
+        if upper_bound is None:
+            return float('inf')
+
+        if upper_bound.is_cancelled():
+            return None
+
+        # Branch & bound: open is ordered, so nothing left in it can beat a solution already found
+        bound = upper_bound.get_cost() if self.optimal else float('inf')
+        return None if priority >= bound else bound
+
     @abstractmethod
     def solve(self, current: ISolvable, goal_states: List[ISolvable],
               heuristic_func: Callable[[ISolvable, ISolvable], float]):
@@ -55,13 +106,32 @@ class AStar(Solver):
               heuristic_func: Callable[[ISolvable, ISolvable], int]) -> \
             Tuple[List[Tuple[ISolvable, int, int]], Dict[ISolvable, Tuple[int, int, int]]]:
         states_graph: Dict[ISolvable, Tuple[ISolvable, Any]] = {}  # Key: Node, Value: FromNode
+        costs: Dict[ISolvable, int] = {current: 0}  # Best cost so far to reach a node
         open_states_set = PriorityQueue()
         open_states_set.enqueue((current, 0, 0), 0)
         closed_states_set = {}
 
+        perimeter = self._perimeter_for(heuristic_func)
+        incumbent = None  # Cheapest (total cost, perimeter state) generated so far
+        if perimeter is not None and current in perimeter:
+            incumbent = (perimeter.cost(current), current)
+
         while not open_states_set.empty():
             f, node = open_states_set.dequeue()
             current_state, g, h = node
+
+            # Nothing left in open can do better than crossing the perimeter where we already did
+            if self._should_stop(f, incumbent):
+                return self._retrace_perimeter_steps(states_graph, incumbent[1]), closed_states_set
+
+            # Outdated entry, node was already reached with a cheaper path
+            if current_state in closed_states_set:
+                continue
+
+            bound = self._bound(f)
+            if bound is None:
+                return None, None
+
             closed_states_set[current_state] = (f, g, h)  # Add in ordered dict representing the closed set
 
             # Reached a goal, return search data
@@ -79,26 +149,41 @@ class AStar(Solver):
                 # CostSoFar + MoveCost
                 next_cost = g + puzzle_move[0]
 
-                # Add or update priority
-                next_heuristic = float('inf')
-                for goal in goal_states:
-                    next_heuristic = min(next_heuristic, heuristic_func(next_state, goal))
+                # If already reached, don't update if it's a worst path
+                if next_state in costs and costs[next_state] <= next_cost:
+                    continue
+
+                # Exact inside the perimeter, at least the perimeter bound outside of it
+                exact_heuristic = None if perimeter is None else perimeter.cost(next_state)
+                if exact_heuristic is not None:
+                    next_heuristic = exact_heuristic
+                else:
+                    next_heuristic = float('inf')
+                    for goal in goal_states:
+                        next_heuristic = min(next_heuristic, heuristic_func(next_state, goal))
+                    if perimeter is not None:
+                        next_heuristic = max(next_heuristic, perimeter.get_bound())
 
                 next_f = self.f(next_cost, next_heuristic)
-                entry = (next_state, next_cost, next_heuristic)
 
-                # If already in open, don't update if it's a worst path
-                if entry in open_states_set:
-                    look_f, _ = open_states_set[entry]
-                    if look_f <= next_f:
-                        continue
+                # Can't beat the upper bound
+                if next_f >= bound:
+                    continue
 
                 # Add or Update
+                costs[next_state] = next_cost
                 open_states_set.enqueue((next_state, next_cost, next_heuristic), next_f)
 
                 # Where from, and with what move
                 states_graph[next_state] = (current_state, puzzle_move)
 
+                if exact_heuristic is not None and (incumbent is None or next_cost + exact_heuristic < incumbent[0]):
+                    incumbent = (next_cost + exact_heuristic, next_state)
+
+        # Open set exhausted, the perimeter crossing found is the best there is
+        if incumbent is not None:
+            return self._retrace_perimeter_steps(states_graph, incumbent[1]), closed_states_set
+
         # If open set empty, failed to solve
         return None, None
 
@@ -111,15 +196,34 @@ class UCS(Solver):
 
     def solve(self, current: ISolvable, goal_states: List[ISolvable],
               heuristic_func: Callable[[ISolvable, ISolvable], float]):
-        self.nodes_costs = {}
         states_graph: Dict[ISolvable, Tuple[ISolvable, Any]] = {}  # Key: Node, Value: FromNode
+        costs: Dict[ISolvable, int] = {current: 0}  # Best cost so far to reach a node
         open_states_set = PriorityQueue()
         open_states_set.enqueue((current, 0, 0), 0)
         closed_states_set = {}
 
+        perimeter = self._perimeter
+        incumbent = None  # Cheapest (total cost, perimeter state) generated so far
+        if perimeter is not None and current in perimeter:
+            incumbent = (perimeter.cost(current), current)
+
         while not open_states_set.empty():
             cost, node = open_states_set.dequeue()
             current_state, _, _ = node
+
+            # Nothing left in open can do better than crossing the perimeter where we already did:
+            # open nodes inside of it are accounted in the incumbent, the others are at least the bound away
+            if self._should_stop(cost + (0 if perimeter is None else perimeter.get_bound()), incumbent):
+                return self._retrace_perimeter_steps(states_graph, incumbent[1]), closed_states_set
+
+            # Outdated entry, node was already reached with a cheaper path
+            if current_state in closed_states_set:
+                continue
+
+            bound = self._bound(cost)
+            if bound is None:
+                return None, None
+
             closed_states_set[current_state] = (cost, cost, 0)  # Add in ordered dict representing the closed set
 
             # Reached a goal, return search data
@@ -133,19 +237,34 @@ class UCS(Solver):
                 # CostSoFar + MoveCost
                 next_cost = cost + puzzle_move[0]
 
-                # Closed already & better solution, back to open
-                if (next_state not in closed_states_set) or (
-                        next_state in closed_states_set and closed_states_set[next_state][0] > next_cost):
-                    if next_state in closed_states_set:
-                        del closed_states_set[next_state]
+                # Closed already (costs are popped in order, so with the cheapest path) or worst path
+                if next_state in closed_states_set or (next_state in costs and costs[next_state] <= next_cost):
+                    continue
+
+                # Can't beat the upper bound
+                if next_cost >= bound:
+                    continue
 
-                    # Add or Update
-                    open_states_set.enqueue((next_state, next_cost, 0), next_cost)
-                    states_graph[next_state] = (current_state, puzzle_move)
+                # Add or Update
+                costs[next_state] = next_cost
+                open_states_set.enqueue((next_state, next_cost, 0), next_cost)
+                states_graph[next_state] = (current_state, puzzle_move)
+
+                exact = None if perimeter is None else perimeter.cost(next_state)
+                if exact is not None and (incumbent is None or next_cost + exact < incumbent[0]):
+                    incumbent = (next_cost + exact, next_state)
+
+        # Open set exhausted, the perimeter crossing found is the best there is
+        if incumbent is not None:
+            return self._retrace_perimeter_steps(states_graph, incumbent[1]), closed_states_set
 
         # If open set empty, failed to solve
         return None, None
 
+    def _perimeter_for(self, heuristic_func):
+        # Heuristic is ignored by UCS
+        return self._perimeter
+
     def f(self, g, h):
         # Search by: total cost from the root to node n
         return g
@@ -153,6 +272,9 @@ class UCS(Solver):
 
 # Greedy Best First Search
 class GBFS(AStar):
+    # Stops as soon as a perimeter state is generated
+    optimal = False
+
     def f(self, g, h):
         # Search by: better heuristic only
         return h